@@ -2,51 +2,191 @@ import platform  # Модуль для получения информации 
 import psutil    # Модуль для получения системной информации
 import socket    # Модуль для сетевых операций и получения IP-адресов
 import datetime  # Модуль для работы с датой и временем
+import time      # Модуль для монотонных отметок времени и локального времени
 import json      # Модуль для работы с JSON форматом
-from typing import Dict, List, Any  # Аннотации типов для лучшей читаемости кода
+import io        # Модуль для построения текста отчета в памяти
+import dataclasses  # Компактные записи для строк отчета (диски, интерфейсы, процессы)
+import functools  # Модуль для кэширования неизменяемых значений
+import heapq     # Модуль для выбора наибольших элементов без полной сортировки
+from itertools import islice  # Итерация по первым элементам без копирования списка
+from concurrent.futures import ThreadPoolExecutor  # Пул потоков для параллельного сбора данных
+from typing import Dict, Iterable, List, Optional, Any  # Аннотации типов для лучшей читаемости кода
+
+GIB = 1 << 30  # Байт в гигабайте
+MIB = 1 << 20  # Байт в мегабайте
+MAX_CPU_SHOWN = 16  # Сколько ядер показывать в строке загрузки по ядрам
+
+# Псевдо-файловые системы, которые не показываются в отчете о дисках
+SKIP_FS = {"squashfs", "tmpfs", "devtmpfs", "overlay", "proc", "sysfs", "cgroup", "cgroup2"}
+
+# Форматирование IP-адресов интерфейса по семейству адреса
+ADDR_FORMATTERS = {
+    socket.AF_INET: lambda a: f"IPv4: {a.address}/{a.netmask}",  # IPv4 адреса
+    socket.AF_INET6: lambda a: f"IPv6: {a.address}",             # IPv6 адреса
+}
+
+@dataclasses.dataclass(slots=True)
+class DiskInfo:
+    """Раздел диска"""
+    device: str                        # Имя устройства (/dev/sda1, C:)
+    mountpoint: str                    # Точка монтирования (/home, C:\)
+    fstype: str                        # Тип файловой системы (NTFS, ext4)
+    total_bytes: int                   # Общий объем (байт)
+    used_bytes: int                    # Использовано (байт)
+    free_bytes: int                    # Свободно (байт)
+    percent: float                     # Процент использования
+    read_bytes: Optional[int] = None   # Прочитано (байт), если статистика доступна
+    write_bytes: Optional[int] = None  # Записано (байт), если статистика доступна
+
+@dataclasses.dataclass(slots=True)
+class InterfaceInfo:
+    """Сетевой интерфейс"""
+    ip_addresses: List[str]  # Список IP-адресов
+    mac: Optional[str]       # MAC-адрес
+    stats: Dict[str, Any]    # Статус интерфейса
+
+@dataclasses.dataclass(slots=True)
+class ProcessInfo:
+    """Процесс"""
+    pid: int                       # Идентификатор процесса
+    name: str                      # Имя процесса
+    cpu_percent: Optional[float]   # Загрузка CPU
+    memory_percent: float          # Доля ОЗУ
+    rss_bytes: int                 # Резидентная память (байт)
+
+def _json_default(obj: Any) -> Any:
+    """Преобразование записей отчета в словари для JSON"""
+    if dataclasses.is_dataclass(obj):
+        return dataclasses.asdict(obj)
+    return str(obj)
+
+@functools.lru_cache(maxsize=1)
+def _get_platform_static() -> tuple:
+    """Название, релиз и версия ОС - не меняются за время работы процесса"""
+    return platform.system(), platform.release(), platform.version()
+
+@functools.lru_cache(maxsize=1)
+def _get_boot_time() -> float:
+    """Время загрузки системы - не меняется за время работы процесса"""
+    return psutil.boot_time()
 
 class SystemReport:
-    def __init__(self, fmt: str = "text"):
+    # Разделы отчета; каждый собирается методом _<раздел>
+    SECTIONS = (
+        "platform",   # Информация о платформе
+        "cpu",        # Данные о процессоре
+        "memory",     # Данные о памяти
+        "disks",      # Информация о дисках
+        "network",    # Сетевые данные
+        "processes",  # Список процессов
+        "users",      # Активные пользователи
+        "boot",       # Время загрузки системы
+        "sensors",    # Данные с датчиков
+    )
+    
+    def __init__(self, fmt: str = "text", min_interval_s: float = 1.0):
         """Инициализация объекта отчета с указанием формата вывода"""
         self.fmt = fmt  # Формат отчета: "text" или "json"
         self.info = {}  # Словарь для хранения собранной информации
         self.time = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")  # Время создания отчета
+        self.min_interval_s = min_interval_s  # Минимальный интервал между реальными сборами
+        self._last_collect_ts = 0.0  # Монотонное время последнего сбора
+        self._collected = False  # Выполнялся ли сбор; отчеты без него запускают полный сбор
+        # Статические данные о платформе запрашиваются в фоне заранее, чтобы к моменту
+        # сбора они уже были готовы; если они уже в кэше, фоновый поток не нужен
+        self._platform_future = None
+        if _get_platform_static.cache_info().currsize == 0:
+            prefetch = ThreadPoolExecutor(max_workers=1)
+            self._platform_future = prefetch.submit(_get_platform_static)
+            prefetch.shutdown(wait=False)
     
-    def collect(self) -> Dict[str, Any]:
-        """Основная функция сбора всей системной информации"""
-        self.info = {
-            "time": self.time,          # Время создания отчета
-            "platform": self._platform(),    # Информация о платформе
-            "cpu": self._cpu(),              # Данные о процессоре
-            "memory": self._memory(),        # Данные о памяти
-            "disks": self._disks(),          # Информация о дисках
-            "network": self._network(),      # Сетевые данные
-            "processes": self._processes(),  # Список процессов
-            "users": self._users(),          # Активные пользователи
-            "boot": self._boot(),            # Время загрузки системы
-            "sensors": self._sensors()       # Данные с датчиков
-        }
+    def collect(self, sections: Iterable[str] = None) -> Dict[str, Any]:
+        """Основная функция сбора системной информации (всей или выбранных разделов)
+        
+        В пределах min_interval_s дособираются только отсутствующие разделы. После
+        истечения интервала данные собираются заново, и разделы, не указанные в
+        sections, из self.info удаляются.
+        """
+        if isinstance(sections, str):
+            sections = (sections,)  # Одно имя раздела, а не последовательность символов
+        names = list(sections) if sections else list(self.SECTIONS)
+        unknown = [name for name in names if name not in self.SECTIONS]
+        if unknown:
+            raise ValueError(f"Неизвестные разделы отчета: {', '.join(unknown)}")
+        
+        # При частых вызовах используем данные последнего сбора,
+        # дособирая только еще не запрошенные разделы
+        fresh = not self.info or (time.monotonic() - self._last_collect_ts) >= self.min_interval_s
+        if fresh:
+            report_time = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")  # Время текущего сбора
+            base = {"time": report_time}  # Время создания отчета
+        else:
+            report_time, base = self.time, self.info
+        missing = [name for name in names if name not in base]
+        if not missing:
+            self._collected = True
+            return self.info
+        
+        # Результаты копятся в локальном словаре: при ошибке любого сборщика
+        # предыдущие данные в self.info остаются нетронутыми
+        results = {}
+        # Загрузка CPU замеряется отдельно: параллельная работа остальных сборщиков
+        # попала бы в замер и завысила показатель
+        if "cpu" in missing:
+            missing.remove("cpu")
+            results["cpu"] = self._cpu()
+        # Остальные сборщики независимы и ждут системных вызовов, поэтому запускаются параллельно
+        if missing:
+            with ThreadPoolExecutor(max_workers=len(missing)) as ex:
+                futures = {name: ex.submit(getattr(self, f"_{name}")) for name in missing}
+                results.update({name: f.result() for name, f in futures.items()})
+        
+        # Новый словарь, чтобы ранее возвращенные снимки не менялись;
+        # разделы хранятся в порядке SECTIONS независимо от порядка запроса
+        merged = {**base, **results}
+        self.info = {key: merged[key] for key in ("time", *self.SECTIONS) if key in merged}
+        self.time = report_time
+        if fresh:
+            # Интервал отсчитывается от момента готовности данных, а не от начала сбора
+            self._last_collect_ts = time.monotonic()
+        self._collected = True
         return self.info
     
     def _platform(self) -> Dict[str, str]:
         """Сбор информации об операционной системе и хосте"""
+        host = socket.gethostname()  # Имя хоста запрашивается один раз
+        try:
+            ip = socket.gethostbyname(host)
+        except OSError:
+            # Имя хоста не разрешается - берем первый IPv4-адрес не loopback-интерфейса
+            ip = next((addr.address
+                       for addrs in psutil.net_if_addrs().values()
+                       for addr in addrs
+                       if addr.family == socket.AF_INET and not addr.address.startswith("127.")),
+                      "N/A")
+        if self._platform_future is not None:
+            system, release, version = self._platform_future.result()
+        else:
+            system, release, version = _get_platform_static()
         return {
-            "system": platform.system(),      # Название ОС (Linux, Windows, macOS)
-            "release": platform.release(),    # Версия релиза ОС
-            "version": platform.version(),    # Полная версия ОС
-            "host": socket.gethostname(),     # Имя хоста компьютера
-            "ip": socket.gethostbyname(socket.gethostname())  # Основной IP-адрес
+            "system": system,                 # Название ОС (Linux, Windows, macOS)
+            "release": release,               # Версия релиза ОС
+            "version": version,               # Полная версия ОС
+            "host": host,                     # Имя хоста компьютера
+            "ip": ip                          # Основной IP-адрес
         }
     
     def _cpu(self) -> Dict[str, Any]:
         """Сбор данных о процессоре: ядра, частота, загрузка"""
         freq = psutil.cpu_freq()  # Получение информации о частоте
+        # Один замер по ядрам вместо двух блокирующих вызовов; общая загрузка - среднее
+        per_cpu = psutil.cpu_percent(interval=0.5, percpu=True)
         return {
             "physical_cores": psutil.cpu_count(logical=False),  # Физические ядра
             "logical_cores": psutil.cpu_count(logical=True),    # Логические ядра
             "freq": f"{freq.current:.0f} MHz" if freq else "N/A",  # Текущая частота
-            "usage": psutil.cpu_percent(interval=0.5),          # Общая загрузка CPU
-            "per_cpu": psutil.cpu_percent(interval=0.5, percpu=True)  # Загрузка по ядрам
+            "usage": round(sum(per_cpu) / len(per_cpu), 1) if per_cpu else 0.0,  # Общая загрузка CPU
+            "per_cpu": per_cpu                                  # Загрузка по ядрам
         }
     
     def _memory(self) -> Dict[str, Any]:
@@ -54,37 +194,35 @@ class SystemReport:
         vmem = psutil.virtual_memory()  # Оперативная память
         swap = psutil.swap_memory()     # Файл подкачки
         return {
-            "total_ram": f"{vmem.total / (1024**3):.1f} GB",      # Всего ОЗУ
-            "used_ram": f"{vmem.used / (1024**3):.1f} GB",        # Использовано ОЗУ
-            "ram_percent": vmem.percent,                          # Процент использования
-            "swap": f"{swap.used / (1024**3):.1f}/{swap.total / (1024**3):.1f} GB"  # Swap
+            "total_ram_bytes": vmem.total,    # Всего ОЗУ (байт)
+            "used_ram_bytes": vmem.used,      # Использовано ОЗУ (байт)
+            "ram_percent": vmem.percent,      # Процент использования
+            "swap_used_bytes": swap.used,     # Использовано swap (байт)
+            "swap_total_bytes": swap.total    # Всего swap (байт)
         }
     
-    def _disks(self) -> List[Dict[str, Any]]:
+    def _disks(self) -> List[DiskInfo]:
         """Сбор информации о дисковых накопителях и разделах"""
         disks = []
+        # Статистика ввода-вывода читается один раз для всех разделов
+        try:
+            io_counters = psutil.disk_io_counters(perdisk=True) or {}
+        except (OSError, RuntimeError):  # NotImplementedError без /proc/diskstats и /sys/block
+            io_counters = {}  # Статистика недоступна на этой платформе
         for part in psutil.disk_partitions():  # Перебор всех разделов
+            if not part.fstype or part.fstype in SKIP_FS:
+                continue  # Пропуск псевдо-файловых систем без лишнего вызова disk_usage
             try:
                 use = psutil.disk_usage(part.mountpoint)  # Использование диска
-                disk_info = {
-                    "device": part.device,      # Имя устройства (/dev/sda1, C:)
-                    "mountpoint": part.mountpoint,  # Точка монтирования (/home, C:\)
-                    "fstype": part.fstype,      # Тип файловой системы (NTFS, ext4)
-                    "total": f"{use.total / (1024**3):.1f} GB",  # Общий объем
-                    "used": f"{use.used / (1024**3):.1f} GB",    # Использовано
-                    "free": f"{use.free / (1024**3):.1f} GB",    # Свободно
-                    "percent": use.percent                         # Процент использования
-                }
+                disk_info = DiskInfo(part.device, part.mountpoint, part.fstype,
+                                     use.total, use.used, use.free, use.percent)
                 
                 # Добавление статистики ввода-вывода если доступно
-                try:
-                    io = psutil.disk_io_counters(perdisk=True).get(part.device.replace("\\", "").replace("/", ""), None)
-                    if io:
-                        disk_info["read_bytes"] = f"{io.read_bytes / (1024**2):.1f} MB"
-                        disk_info["write_bytes"] = f"{io.write_bytes / (1024**2):.1f} MB"
-                except:
-                    pass
-                    
+                io = io_counters.get(part.device.replace("\\", "").replace("/", ""), None)
+                if io:
+                    disk_info.read_bytes = io.read_bytes
+                    disk_info.write_bytes = io.write_bytes
+                
                 disks.append(disk_info)
             except (PermissionError, OSError):
                 continue  # Пропуск недоступных разделов
@@ -95,6 +233,8 @@ class SystemReport:
         io = psutil.net_io_counters()           # Общая сетевая статистика
         net_if_addrs = psutil.net_if_addrs()    # Адреса сетевых интерфейсов
         net_if_stats = psutil.net_if_stats()    # Статус интерфейсов
+        # Локальные имена вместо поиска атрибутов на каждой итерации
+        get_formatter, AF_LINK = ADDR_FORMATTERS.get, psutil.AF_LINK
         
         interfaces = {}
         for iface, addrs in net_if_addrs.items():  # Анализ каждого интерфейса
@@ -103,68 +243,68 @@ class SystemReport:
             
             # Обработка всех адресов интерфейса
             for addr in addrs:
-                if addr.family == socket.AF_INET:  # IPv4 адреса
-                    ip_addresses.append(f"IPv4: {addr.address}/{addr.netmask}")
-                elif addr.family == socket.AF_INET6:  # IPv6 адреса
-                    ip_addresses.append(f"IPv6: {addr.address}")
-                elif addr.family == psutil.AF_LINK:  # MAC-адрес
+                formatter = get_formatter(addr.family)
+                if formatter:  # IPv4 и IPv6 адреса
+                    ip_addresses.append(formatter(addr))
+                elif addr.family == AF_LINK:  # MAC-адрес
                     mac_address = addr.address
             
             # Получение статуса интерфейса
             stats = {}
-            if iface in net_if_stats:
-                stat = net_if_stats[iface]
+            stat = net_if_stats.get(iface)
+            if stat:
                 stats = {
                     "is_up": "UP" if stat.isup else "DOWN",  # Состояние интерфейса
                     "speed": f"{stat.speed} Mbps" if stat.speed > 0 else "N/A",  # Скорость
                     "mtu": stat.mtu  # Maximum Transmission Unit
                 }
             
-            interfaces[iface] = {
-                "ip_addresses": ip_addresses,  # Список IP-адресов
-                "mac": mac_address,            # MAC-адрес
-                "stats": stats                 # Статус интерфейса
-            }
+            interfaces[iface] = InterfaceInfo(ip_addresses, mac_address, stats)
         
         return {
-            "bytes_sent": f"{io.bytes_sent / (1024**2):.1f} MB",      # Отправлено данных
-            "bytes_recv": f"{io.bytes_recv / (1024**2):.1f} MB",      # Получено данных
+            "bytes_sent": io.bytes_sent,                              # Отправлено данных (байт)
+            "bytes_recv": io.bytes_recv,                              # Получено данных (байт)
             "packets_sent": io.packets_sent,                          # Отправлено пакетов
             "packets_recv": io.packets_recv,                          # Получено пакетов
             "interfaces": interfaces                                   # Данные по интерфейсам
         }
     
-    def _processes(self) -> List[Dict[str, Any]]:
+    def _processes(self) -> List[ProcessInfo]:
         """Получение списка топ-8 процессов по использованию памяти"""
         procs = []
-        # Итерация по всем процессам
-        for p in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent']):
+        total_mem = psutil.virtual_memory().total  # Объем ОЗУ читается один раз для всех процессов
+        # Итерация по всем процессам: все поля читаются итератором за один проход по /proc
+        for p in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_info']):
             try:
                 info = p.info  # Основная информация о процессе
-                # Добавление информации об использовании памяти в МБ
-                info['memory_mb'] = psutil.Process(p.info['pid']).memory_info().rss / (1024**2)
-                procs.append(info)
+                mem_info = info.pop('memory_info')
+                if mem_info is None:
+                    continue  # Нет доступа к памяти процесса
+                # Процент памяти считается по уже прочитанному RSS, объем хранится в байтах
+                procs.append(ProcessInfo(info['pid'], info['name'], info['cpu_percent'],
+                                         mem_info.rss * 100.0 / total_mem, mem_info.rss))
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 continue  # Пропуск недоступных процессов
         
-        # Сортировка по использованию памяти (по убыванию)
-        procs.sort(key=lambda x: x.get('memory_percent', 0), reverse=True)
-        return procs[:8]  # Возврат топ-8 процессов
+        # Выбор топ-8 процессов по использованию памяти (по убыванию)
+        return heapq.nlargest(8, procs, key=lambda x: x.memory_percent)
     
     def _users(self) -> List[Dict[str, Any]]:
         """Получение списка активных пользователей в системе"""
         users = []
+        localtime = time.localtime  # Локальное имя для вызова в цикле
         for user in psutil.users():  # Перебор всех активных пользователей
+            tm = localtime(user.started)
             users.append({
                 "name": user.name,      # Имя пользователя
                 "host": user.host,      # С какого хоста подключен
-                "started": datetime.datetime.fromtimestamp(user.started).strftime("%H:%M:%S")  # Время входа
+                "started": f"{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}"  # Время входа
             })
         return users
     
     def _boot(self) -> str:
         """Получение времени последней загрузки системы"""
-        return datetime.datetime.fromtimestamp(psutil.boot_time()).strftime("%Y-%m-%d %H:%M:%S")
+        return datetime.datetime.fromtimestamp(_get_boot_time()).strftime("%Y-%m-%d %H:%M:%S")
     
     def _sensors(self) -> Dict[str, Any]:
         """Получение данных с температурных датчиков (если доступно)"""
@@ -173,119 +313,134 @@ class SystemReport:
             sensors = {}
             if temps:
                 for name, entries in temps.items():  # Обработка каждого датчика
-                    sensors[name] = [{"current": entry.current} for entry in entries[:2]]
+                    sensors[name] = [{"current": entry.current} for entry in islice(entries, 2)]
             return sensors
         except AttributeError:
             return {"info": "N/A"}  # Если датчики недоступны
     
     def text_report(self) -> str:
         """Формирование текстового отчета в удобочитаемом формате"""
-        report = [
-            "=" * 60,
-            f"СИСТЕМНЫЙ ОТЧЕТ - {self.time}",
-            "=" * 60
-        ]
+        if not self._collected:
+            self.collect()
+        buf = io.StringIO()  # Буфер, в который отчет пишется построчно
+        w = buf.write
+        w("=" * 60 + "\n")
+        w(f"СИСТЕМНЫЙ ОТЧЕТ - {self.time}\n")
+        w("=" * 60 + "\n")
+        
+        # Разделы, которые не собирались, в отчет не попадают
+        info = self.info
         
         # Добавление информации о платформе
-        report.extend([
-            "\nПЛАТФОРМА:",
-            "-" * 40,
-            f"Система: {self.info['platform']['system']} {self.info['platform']['release']}",
-            f"Версия: {self.info['platform']['version']}",
-            f"Хост: {self.info['platform']['host']}",
-            f"IP-адрес: {self.info['platform']['ip']}"
-        ])
+        if 'platform' in info:
+            plat = info['platform']
+            w("\nПЛАТФОРМА:\n")
+            w("-" * 40 + "\n")
+            w(f"Система: {plat['system']} {plat['release']}\n"
+              f"Версия: {plat['version']}\n"
+              f"Хост: {plat['host']}\n"
+              f"IP-адрес: {plat['ip']}\n")
         
         # Добавление информации о процессоре
-        cpu = self.info['cpu']
-        report.extend([
-            "\nПРОЦЕССОР:",
-            "-" * 40,
-            f"Ядра: {cpu['physical_cores']} физических, {cpu['logical_cores']} логических",
-            f"Частота: {cpu['freq']}",
-            f"Загрузка: {cpu['usage']}%",
-            f"По ядрам: {', '.join([f'{p}%' for p in cpu['per_cpu']])}"
-        ])
+        if 'cpu' in info:
+            cpu = info['cpu']
+            per_cpu = cpu['per_cpu']
+            per_cpu_text = ', '.join(f'{p}%' for p in islice(per_cpu, MAX_CPU_SHOWN))
+            if len(per_cpu) > MAX_CPU_SHOWN:
+                per_cpu_text += f" (и еще {len(per_cpu) - MAX_CPU_SHOWN})"
+            w("\nПРОЦЕССОР:\n")
+            w("-" * 40 + "\n")
+            w(f"Ядра: {cpu['physical_cores']} физических, {cpu['logical_cores']} логических\n"
+              f"Частота: {cpu['freq']}\n"
+              f"Загрузка: {cpu['usage']}%\n"
+              f"По ядрам: {per_cpu_text}\n")
         
         # Добавление информации о памяти
-        mem = self.info['memory']
-        report.extend([
-            "\nПАМЯТЬ:",
-            "-" * 40,
-            f"ОЗУ: {mem['used_ram']} / {mem['total_ram']} ({mem['ram_percent']}%)",
-            f"SWAP: {mem['swap']}"
-        ])
+        if 'memory' in info:
+            mem = info['memory']
+            w("\nПАМЯТЬ:\n")
+            w("-" * 40 + "\n")
+            w(f"ОЗУ: {mem['used_ram_bytes'] / GIB:.1f} GB / {mem['total_ram_bytes'] / GIB:.1f} GB ({mem['ram_percent']}%)\n"
+              f"SWAP: {mem['swap_used_bytes'] / GIB:.1f}/{mem['swap_total_bytes'] / GIB:.1f} GB\n")
         
         # Добавление информации о дисках
-        report.extend(["\nДИСКОВЫЕ НАКОПИТЕЛИ:", "-" * 40])
-        for i, disk in enumerate(self.info['disks'], 1):
-            disk_info = [
-                f"{i}. {disk['device']} → {disk['mountpoint']}",
-                f"   Тип: {disk['fstype']}, Всего: {disk['total']}",
-                f"   Использовано: {disk['used']} ({disk['percent']}%), Свободно: {disk['free']}"
-            ]
-            if 'read_bytes' in disk:
-                disk_info.append(f"   Чтение: {disk['read_bytes']}, Запись: {disk['write_bytes']}")
-            report.extend(disk_info)
+        if 'disks' in info:
+            w("\nДИСКОВЫЕ НАКОПИТЕЛИ:\n")
+            w("-" * 40 + "\n")
+            for i, disk in enumerate(info['disks'], 1):
+                w(f"{i}. {disk.device} → {disk.mountpoint}\n"
+                  f"   Тип: {disk.fstype}, Всего: {disk.total_bytes / GIB:.1f} GB\n"
+                  f"   Использовано: {disk.used_bytes / GIB:.1f} GB ({disk.percent}%), "
+                  f"Свободно: {disk.free_bytes / GIB:.1f} GB\n")
+                if disk.read_bytes is not None:
+                    w(f"   Чтение: {disk.read_bytes / MIB:.1f} MB, Запись: {disk.write_bytes / MIB:.1f} MB\n")
         
         # Добавление сетевой информации
-        net = self.info['network']
-        report.extend([
-            "\nСЕТЕВЫЕ ИНТЕРФЕЙСЫ:",
-            "-" * 40,
-            f"Отправлено: {net['bytes_sent']}, Получено: {net['bytes_recv']}",
-            f"Пакеты: отправлено {net['packets_sent']}, получено {net['packets_recv']}"
-        ])
-        
-        # Добавление информации о каждом сетевом интерфейсе
-        for iface, info in net['interfaces'].items():
-            if info['ip_addresses']:
-                report.append(f"\n{iface}:")
-                if info['mac']:
-                    report.append(f"  MAC: {info['mac']}")
-                for ip in info['ip_addresses'][:2]:  # Показываем первые 2 адреса
-                    report.append(f"  {ip}")
-                if info['stats']:
-                    report.append(f"  Статус: {info['stats']['is_up']}, "
-                                 f"Скорость: {info['stats']['speed']}")
+        if 'network' in info:
+            net = info['network']
+            w("\nСЕТЕВЫЕ ИНТЕРФЕЙСЫ:\n")
+            w("-" * 40 + "\n")
+            w(f"Отправлено: {net['bytes_sent'] / MIB:.1f} MB, Получено: {net['bytes_recv'] / MIB:.1f} MB\n"
+              f"Пакеты: отправлено {net['packets_sent']}, получено {net['packets_recv']}\n")
+            
+            # Добавление информации о каждом сетевом интерфейсе
+            for iface, iface_info in net['interfaces'].items():
+                if iface_info.ip_addresses:
+                    w(f"\n{iface}:\n")
+                    if iface_info.mac:
+                        w(f"  MAC: {iface_info.mac}\n")
+                    for ip in islice(iface_info.ip_addresses, 2):  # Показываем первые 2 адреса
+                        w(f"  {ip}\n")
+                    if iface_info.stats:
+                        w(f"  Статус: {iface_info.stats['is_up']}, "
+                          f"Скорость: {iface_info.stats['speed']}\n")
         
         # Добавление информации о процессах
-        report.extend(["\nТОП-8 ПРОЦЕССОВ:", "-" * 40])
-        for i, proc in enumerate(self.info['processes'], 1):
-            report.append(f"{i}. {proc['name'][:20]:20} "
-                         f"PID:{proc['pid']:6} "
-                         f"CPU:{proc['cpu_percent']:5.1f}% "
-                         f"MEM:{proc['memory_percent']:5.1f}%")
+        if 'processes' in info:
+            w("\nТОП-8 ПРОЦЕССОВ:\n")
+            w("-" * 40 + "\n")
+            for i, proc in enumerate(info['processes'], 1):
+                w(f"{i}. {proc.name[:20]:20} "
+                  f"PID:{proc.pid:6} "
+                  f"CPU:{proc.cpu_percent or 0.0:5.1f}% "
+                  f"MEM:{proc.memory_percent:5.1f}%\n")
         
         # Добавление информации о пользователях
-        if self.info['users']:
-            report.extend(["\nАКТИВНЫЕ ПОЛЬЗОВАТЕЛИ:", "-" * 40])
-            for user in self.info['users']:
-                report.append(f"{user['name']} с {user['host']} (с {user['started']})")
+        if info.get('users'):
+            w("\nАКТИВНЫЕ ПОЛЬЗОВАТЕЛИ:\n")
+            w("-" * 40 + "\n")
+            for user in info['users']:
+                w(f"{user['name']} с {user['host']} (с {user['started']})\n")
         
         # Добавление времени загрузки и завершение отчета
-        report.extend([
-            f"\nВРЕМЯ ЗАГРУЗКИ: {self.info['boot']}",
-            "=" * 60
-        ])
+        if 'boot' in info:
+            w(f"\nВРЕМЯ ЗАГРУЗКИ: {info['boot']}\n")
+        else:
+            w("\n")
+        w("=" * 60)
         
-        return "\n".join(report)
+        return buf.getvalue()
     
     def json_report(self) -> str:
         """Формирование отчета в формате JSON"""
-        return json.dumps(self.info, indent=2, default=str)
+        if not self._collected:
+            self.collect()
+        return json.dumps(self.info, indent=2, default=_json_default)
     
     def save(self, fname: str = None) -> str:
         """Сохранение отчета в файл"""
         if not fname:
             fname = f"system_report_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}"
         fname += ".json" if self.fmt == "json" else ".txt"
-        
-        # Выбор содержимого в зависимости от формата
-        content = self.json_report() if self.fmt == "json" else self.text_report()
+        if not self._collected:
+            self.collect()  # Сбор до открытия файла, чтобы ошибка не оставила пустой отчет
         
         with open(fname, 'w', encoding='utf-8') as f:
-            f.write(content)
+            if self.fmt == "json":
+                # JSON пишется в файл потоково, без промежуточной строки
+                json.dump(self.info, f, indent=2, default=_json_default)
+            else:
+                f.write(self.text_report())
         return fname
 
 def main():
@@ -297,12 +452,16 @@ def main():
     parser.add_argument("--output", "-o", help="Имя выходного файла")
     parser.add_argument("--print", "-p", action="store_true",
                        help="Вывести отчет в консоль")
+    parser.add_argument("--sections", "-s", nargs="+", choices=SystemReport.SECTIONS,
+                       help="Собрать только указанные разделы (по умолчанию все)")
     
     args = parser.parse_args()
     
     try:
         report = SystemReport(args.format)  # Создание объекта отчета
-        report.collect()  # Сбор системной информации
+        # Без выбора разделов сбор выполнит первый сформированный отчет
+        if args.sections:
+            report.collect(args.sections)  # Сбор выбранных разделов
         
         # Вывод отчета в консоль если указан флаг --print
         if args.print: